@@ -5,10 +5,33 @@ Alert management system for custom user notifications
 
 import json
 import os
-from typing import Dict, List, Optional, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set
 from datetime import datetime, time
 from utils.timezone_handler import TimezoneHandler
 
+@lru_cache(maxsize=64)
+def _parse_hhmm(value: str) -> time:
+    """Parse an HH:MM time without going through strptime"""
+    if len(value) == 5 and value[2] == ":" and value[:2].isdigit() and value[3:].isdigit():
+        # time() rejects out-of-range hours and minutes with ValueError, like strptime
+        return time(int(value[:2]), int(value[3:]))
+    # Less common spellings such as "9:00"
+    return datetime.strptime(value, "%H:%M").time()
+
+@dataclass(frozen=True, slots=True)
+class ResolvedAlertSettings:
+    """A user's alert settings, pre-parsed for per-signal filtering"""
+    enabled: bool
+    min_confidence: float
+    signal_types: FrozenSet[str]
+    preferred_assets: Optional[FrozenSet[str]]  # None means all assets
+    excluded_assets: FrozenSet[str]
+    start_time: time
+    end_time: time
+    weekend_alerts: bool
+
 class AlertManager:
     """Manages custom alert settings for users"""
     
@@ -49,6 +72,26 @@ class AlertManager:
         with open(self.alerts_file, 'w') as f:
             json.dump(self.user_alerts, f, indent=2)
     
+    def parse_alert_time(self, value: str) -> time:
+        """Parse an HH:MM alert time, reusing previously parsed values"""
+        return _parse_hhmm(value)
+    
+    def resolve_user_settings(self, user_id: int) -> ResolvedAlertSettings:
+        """Get a user's settings with lists as frozensets and alert times parsed"""
+        settings = self.get_user_settings(user_id)
+        preferred = settings.get("preferred_assets", ["all"])
+        alert_times = settings.get("alert_times", {})
+        return ResolvedAlertSettings(
+            enabled=settings.get("enabled", True),
+            min_confidence=settings.get("min_confidence", 75),
+            signal_types=frozenset(settings.get("signal_types", ["BUY", "SELL"])),
+            preferred_assets=None if "all" in preferred else frozenset(preferred),
+            excluded_assets=frozenset(settings.get("excluded_assets", [])),
+            start_time=self.parse_alert_time(alert_times.get("start", "09:00")),
+            end_time=self.parse_alert_time(alert_times.get("end", "22:00")),
+            weekend_alerts=settings.get("weekend_alerts", False)
+        )
+    
     def get_user_settings(self, user_id: int) -> Dict:
         """Get alert settings for a user"""
         user_id_str = str(user_id)
@@ -88,9 +131,9 @@ class AlertManager:
             if "alert_times" in settings:
                 times = settings["alert_times"]
                 if "start" in times:
-                    datetime.strptime(times["start"], "%H:%M")
+                    self.parse_alert_time(times["start"])
                 if "end" in times:
-                    datetime.strptime(times["end"], "%H:%M")
+                    self.parse_alert_time(times["end"])
             
             # Validate max signals per hour
             if "max_signals_per_hour" in settings:
@@ -109,51 +152,44 @@ class AlertManager:
         except (ValueError, TypeError, KeyError):
             return False
     
-    def should_send_alert(self, user_id: int, signal_data: Dict) -> bool:
+    def should_send_alert(self, user_id: int, signal_data: Dict, now: Optional[datetime] = None,
+                          settings: Optional[ResolvedAlertSettings] = None) -> bool:
         """Check if alert should be sent to user based on their settings"""
-        settings = self.get_user_settings(user_id)
+        if settings is None:
+            settings = self.resolve_user_settings(user_id)
         
         # Check if alerts are enabled
-        if not settings.get("enabled", True):
+        if not settings.enabled:
             return False
         
         # Check confidence level
-        signal_confidence = signal_data.get("confidence", 0)
-        min_confidence = settings.get("min_confidence", 75)
-        if signal_confidence < min_confidence:
+        if signal_data.get("confidence", 0) < settings.min_confidence:
             return False
         
         # Check signal direction
-        signal_direction = signal_data.get("direction", "")
-        allowed_types = settings.get("signal_types", ["BUY", "SELL"])
-        if signal_direction not in allowed_types:
+        if signal_data.get("direction", "") not in settings.signal_types:
             return False
         
         # Check asset preferences
         asset = signal_data.get("asset", "")
-        preferred_assets = settings.get("preferred_assets", ["all"])
-        excluded_assets = settings.get("excluded_assets", [])
         
         # Check if asset is excluded
-        if asset in excluded_assets:
+        if asset in settings.excluded_assets:
             return False
         
         # Check if asset is in preferred list (unless "all" is selected)
-        if "all" not in preferred_assets and asset not in preferred_assets:
+        if settings.preferred_assets is not None and asset not in settings.preferred_assets:
             return False
         
         # Check time restrictions
-        current_time = self.timezone_handler.now().time()
-        alert_times = settings.get("alert_times", {})
-        start_time = datetime.strptime(alert_times.get("start", "09:00"), "%H:%M").time()
-        end_time = datetime.strptime(alert_times.get("end", "22:00"), "%H:%M").time()
-        
-        if not (start_time <= current_time <= end_time):
+        if now is None:
+            now = self.timezone_handler.now()
+        if not (settings.start_time <= now.time() <= settings.end_time):
             return False
         
         # Check weekend settings
-        if not settings.get("weekend_alerts", False):
-            current_day = self.timezone_handler.now().weekday()
+        if not settings.weekend_alerts:
+            current_day = now.weekday()
             if current_day >= 5:  # Saturday = 5, Sunday = 6
                 return False
         
@@ -195,4 +231,3 @@ class AlertManager:
 📅 **Weekend Alerts:** {weekend}
 
 Use /alerts to modify these settings."""
-```
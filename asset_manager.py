@@ -8,6 +8,14 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from config.settings import CURRENCY_PAIRS, CRYPTOCURRENCIES, OTC_CURRENCY_PAIRS, OTC_CRYPTOCURRENCIES
 
+# Asset category -> name shown to users
+_CATEGORY_DISPLAY_NAMES = {
+    "currency_pairs": "Currency Pair",
+    "cryptocurrencies": "Cryptocurrency",
+    "otc_currency_pairs": "OTC Currency Pair",
+    "otc_cryptocurrencies": "OTC Cryptocurrency"
+}
+
 class AssetManager:
     """Manages asset rotation and selection for trading signals"""
     
@@ -89,15 +97,11 @@ class AssetManager:
                 return category
         return "unknown"
     
-    def get_category_display_name(self, category: str) -> str:
+    @staticmethod
+    def get_category_display_name(category: str) -> str:
         """Get display name for category"""
-        display_names = {
-            "currency_pairs": "Currency Pair",
-            "cryptocurrencies": "Cryptocurrency", 
-            "otc_currency_pairs": "OTC Currency Pair",
-            "otc_cryptocurrencies": "OTC Cryptocurrency"
-        }
-        return display_names.get(category, category.title())
+        display_name = _CATEGORY_DISPLAY_NAMES.get(category)
+        return display_name if display_name is not None else category.title()
     
     def reset_usage_stats(self):
         """Reset usage statistics"""
@@ -31,7 +31,6 @@ def setup_logging():
     
     # Configure specific loggers
     logging.getLogger("telegram").setLevel(logging.INFO)
-    logging.getLogger("apscheduler").setLevel(logging.INFO)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     
     # Create logger for the application
@@ -0,0 +1,41 @@
+"""
+Async rate limiting for outgoing Telegram API calls
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket allowing at most `rate` acquisitions per `period` seconds"""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.last_refill = time.monotonic()
+        # Waiters are served in FIFO order
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens accrued since the last refill, up to bucket capacity"""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.rate, self.tokens + elapsed * self.rate / self.period)
+        self.last_refill = now
+
+    def is_full(self) -> bool:
+        """Check whether the bucket is idle at full capacity"""
+        if self._lock.locked():
+            return False
+        self._refill()
+        return self.tokens >= self.rate
+
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+                self._refill()
+            self.tokens -= 1
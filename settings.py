@@ -3,17 +3,43 @@ Configuration settings for the trading bot
 """
 
 import os
-from typing import Dict, List
+from typing import Dict, Final, List
 
 # Bot Configuration
 BOT_TOKEN = os.getenv("BOT_TOKEN", "")
 ADMIN_USER_IDS = [int(id.strip()) for id in os.getenv("ADMIN_USER_IDS", "7149581100").split(",") if id.strip()]
 
+# Update Delivery Configuration
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")  # public base URL; leave empty to use long polling
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("PORT", "8443"))
+POLLING_TIMEOUT = 20  # seconds each getUpdates long poll stays open
+
+# Telegram HTTP Configuration (shared connection pool for outgoing API calls)
+TELEGRAM_CONNECTION_POOL_SIZE = 100
+TELEGRAM_CONNECT_TIMEOUT = 10.0
+TELEGRAM_READ_TIMEOUT = 30.0
+TELEGRAM_POOL_TIMEOUT = 30.0
+TELEGRAM_HTTP_VERSION = os.getenv("TELEGRAM_HTTP_VERSION", "2")  # "2" multiplexes sends over one connection
+
+# Broadcast Configuration
+BROADCAST_MAX_CONCURRENCY = 30  # sendMessage calls in flight at once
+TELEGRAM_GLOBAL_RATE_LIMIT = 30  # messages per second (Bot API limit)
+BROADCAST_SEND_TIMEOUT_SECONDS = 5.0  # per-recipient HTTP read/write timeout for broadcast sends
+TELEGRAM_PER_CHAT_RATE_LIMIT = 1  # messages per second to any one chat
+BROADCAST_LOG_CHAT_ID = int(os.getenv("BROADCAST_LOG_CHAT_ID", "0"))  # broadcasts are posted here once and copied to users; 0 sends directly
+
+# Subscription Configuration
+ACCESS_CACHE_TTL_SECONDS = 60  # how long a check_user_access result is reused
+USERS_LIST_CACHE_TTL_SECONDS = 30  # how long a formatted /users listing is reused
+
 # Signal Configuration
-SIGNAL_INTERVAL_MINUTES = 5
-SIGNAL_EXPIRATION_MINUTES = 3
-TARGET_ACCURACY = 90.0
-MINIMUM_CONFIDENCE = 65.0
+SIGNAL_INTERVAL_MINUTES: Final[int] = 5
+SIGNAL_EXPIRATION_MINUTES: Final[int] = 3
+TARGET_ACCURACY: Final[float] = 90.0
+MINIMUM_CONFIDENCE: Final[float] = 65.0
+SIGNAL_PLACEHOLDER_DELAY_SECONDS: Final[float] = 0.5  # show "Generating..." only if generation takes longer
+SIGNAL_SHARE_WINDOW_SECONDS: Final[float] = 3.0  # on-demand requests within this window share one signal
 
 # Timezone Configuration
 TIMEZONE = "Africa/Lagos"  # GMT+1 Nigeria time
@@ -12,6 +12,14 @@ from bot.signal_validator import SignalValidator
 from utils.timezone_handler import TimezoneHandler
 from config.settings import SIGNAL_EXPIRATION_MINUTES, TARGET_ACCURACY, MINIMUM_CONFIDENCE
 
+# Keyword found in a signal's reasoning -> strategy shown to users, first match wins
+_STRATEGY_TABLE = (
+    ("BOLLINGER", "Bollinger Bands + RSI"),
+    ("STOCHASTIC", "Stochastic + MACD"),
+    ("MACD", "MACD + RSI"),
+)
+_DEFAULT_STRATEGY = "RSI + MACD Divergence"
+
 class SignalGenerator:
     """Generates high-quality trading signals with advanced analysis"""
     
@@ -85,6 +93,7 @@ class SignalGenerator:
             
             # Generate entry reasoning
             reasoning = self._generate_entry_reasoning(analysis, signal_direction)
+            strategy = next((name for keyword, name in _STRATEGY_TABLE if keyword in reasoning), _DEFAULT_STRATEGY)
             
             # Create signal data
             current_time = self.timezone_handler.now()
@@ -98,6 +107,7 @@ class SignalGenerator:
                 "expiration_time": expiration_time,
                 "generated_time": current_time,
                 "reasoning": reasoning,
+                "strategy": strategy,
                 "analysis": analysis,
                 "accuracy_target": self.accuracy_target
             }
@@ -3,23 +3,507 @@ Telegram bot for binary options trading signals
 """
 
 import asyncio
+import heapq
 import logging
-from typing import Dict, List, Optional
+import operator
+import re
+import signal
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from telegram import Update, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from telegram import Update, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup, LinkPreviewOptions
+from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, Defaults, filters, ContextTypes
+from telegram.error import BadRequest, Forbidden, RetryAfter, TimedOut
+from telegram.request import HTTPXRequest
+
+try:
+    import h2  # noqa: F401  (HTTP/2 support for httpx, from python-telegram-bot[http2])
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 from bot.signal_generator import SignalGenerator
 from bot.subscription_manager import SubscriptionManager
-from bot.alert_manager import AlertManager
+from bot.alert_manager import AlertManager, ResolvedAlertSettings
+from bot.rate_limiter import AsyncTokenBucket
+from bot.user_registry import UserRegistry
 from utils.timezone_handler import TimezoneHandler
-from config.settings import SIGNAL_INTERVAL_MINUTES, ADMIN_USER_IDS
+from config.settings import (
+    SIGNAL_INTERVAL_MINUTES, SIGNAL_PLACEHOLDER_DELAY_SECONDS, SIGNAL_SHARE_WINDOW_SECONDS, ADMIN_USER_IDS,
+    TELEGRAM_CONNECTION_POOL_SIZE, TELEGRAM_CONNECT_TIMEOUT, TELEGRAM_READ_TIMEOUT,
+    TELEGRAM_POOL_TIMEOUT, TELEGRAM_HTTP_VERSION, BROADCAST_MAX_CONCURRENCY, TELEGRAM_GLOBAL_RATE_LIMIT, BROADCAST_SEND_TIMEOUT_SECONDS,
+    TELEGRAM_PER_CHAT_RATE_LIMIT, BROADCAST_LOG_CHAT_ID,
+    WEBHOOK_URL, WEBHOOK_LISTEN, WEBHOOK_PORT, POLLING_TIMEOUT, ACCESS_CACHE_TTL_SECONDS,
+    USERS_LIST_CACHE_TTL_SECONDS
+)
+
+# Admin membership is checked on every admin command and menu stats press
+_ADMIN_IDS = frozenset(ADMIN_USER_IDS)
+
+# Keywords that get a signal-related reply from handle_message
+_KEYWORD_RE = re.compile(r"signal|trade|buy|sell|option", re.IGNORECASE)
+
+# 24-hour HH:MM alert time
+_HHMM_RE = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+
+_VALID_SIGNAL_TYPES = frozenset({"BUY", "SELL"})
+
+# Inline buttons that require an active subscription
+_PROTECTED_CALLBACKS = frozenset({"get_signal", "alerts", "stats", "portfolio"})
+
+# Admin commands run without blocking other handlers (file writes, long listings)
+_ADMIN_COMMANDS = ("verify", "admin", "users")
+
+# Signal direction -> option type and market-condition suffix
+_OPTION_TYPES = {"BUY": "CALL", "SELL": "PUT"}
+_MARKET_CONFIRMATIONS = {"BUY": " + Bullish Cross Confirmed", "SELL": " + Bearish Cross Confirmed"}
+
+# Signal message scaffold shared by /signal, the menu button and broadcasts
+_SIGNAL_TEMPLATE = """Pocket Option Signal Alert
+🔔 Auto-Generated Trading Signal
+
+🕒 Time (GMT+1): {time}
+📉 Asset: {asset}
+📈 Direction: {direction} ({option_type})
+⏳ Expiry Time: 3 minutes
+🎯 Entry Price: {entry_price}
+⚠️ Confidence Level: {confidence:.0f}%
+📊 Strategy Used: {strategy}
+📍 Market Condition: {market_condition}
+
+✅ Wait for stable candle close before entry.
+
+---
+
+📥 Signal Status:
+✅ Signal Activated
+📊 Result: Pending
+💰 Profit: Calculating..."""
+
+# Appended to signals shown from the inline menu
+_QUICK_ACTIONS_FOOTER = "\n\n🔽 Quick Actions:"
+
+
+# Values /setalert treats as "on"
+_TRUTHY = frozenset({"true", "yes", "1", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse an on/off style setting value"""
+    return value.lower() in _TRUTHY
+
+
+def _is_chat_not_found(error: BadRequest) -> bool:
+    """Check whether a BadRequest means the target chat doesn't exist"""
+    return "chat not found" in error.message.lower()
+
+
+def _parse_alert_time(value: str, alert_manager: AlertManager, user_id: int, key: str) -> Dict:
+    """Return the user's alert window with one boundary replaced"""
+    # Validate time format
+    if not _HHMM_RE.match(value):
+        raise ValueError("Invalid time format")
+    current_settings = alert_manager.get_user_settings(user_id)
+    alert_times = dict(current_settings.get("alert_times", {}))
+    alert_times[key] = value
+    return alert_times
+
+
+def _parse_confidence(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert confidence"""
+    return "min_confidence", int(value)
+
+
+def _parse_enabled(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert enabled"""
+    return "enabled", _parse_bool(value)
+
+
+def _parse_start_time(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert start"""
+    return "alert_times", _parse_alert_time(value, alert_manager, user_id, "start")
+
+
+def _parse_end_time(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert end"""
+    return "alert_times", _parse_alert_time(value, alert_manager, user_id, "end")
+
+
+def _parse_signal_types(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert types"""
+    types = [t.strip().upper() for t in value.split(",")]
+    if not _VALID_SIGNAL_TYPES.issuperset(types):
+        raise ValueError("Invalid signal types")
+    return "signal_types", types
+
+
+def _parse_preferred_assets(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert assets"""
+    if value.lower() == "all":
+        return "preferred_assets", ["all"]
+    return "preferred_assets", [a.strip() for a in value.split(",")]
+
+
+def _parse_excluded_assets(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert exclude"""
+    if value.lower() == "none":
+        return "excluded_assets", []
+    return "excluded_assets", [a.strip() for a in value.split(",")]
+
+
+def _parse_max_per_hour(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert maxhour"""
+    return "max_signals_per_hour", int(value)
+
+
+def _parse_weekend(value: str, alert_manager: AlertManager, user_id: int) -> Tuple[str, Any]:
+    """Parse /setalert weekend"""
+    return "weekend_alerts", _parse_bool(value)
+
+
+# /setalert setting name (and aliases) -> parser returning (settings key, value)
+_SETTING_HANDLERS: Dict[str, Callable[[str, AlertManager, int], Tuple[str, Any]]] = {
+    "confidence": _parse_confidence,
+    "enabled": _parse_enabled,
+    "start": _parse_start_time,
+    "begin": _parse_start_time,
+    "end": _parse_end_time,
+    "types": _parse_signal_types,
+    "directions": _parse_signal_types,
+    "assets": _parse_preferred_assets,
+    "pairs": _parse_preferred_assets,
+    "exclude": _parse_excluded_assets,
+    "maxhour": _parse_max_per_hour,
+    "max_hour": _parse_max_per_hour,
+    "ratelimit": _parse_max_per_hour,
+    "weekend": _parse_weekend,
+}
+
+
+# /start greeting; only the user's name and access status vary
+_WELCOME_TEMPLATE = """
+🚀 **Binary Options Trading Signals Bot**
+
+Welcome {user_name}! 
+
+✅ **Access Status:** {access_message}
+
+This bot provides high-accuracy binary options trading signals with:
+• 🎯 90% accuracy target
+• 📊 Manual signal generation
+• ⏱️ 3-minute expiration times
+• 📊 Multiple asset categories
+• 🇳🇬 Nigeria time (GMT+1)
+
+**Available Commands:**
+/start - Start the bot
+/signal - 🎯 Get a new trading signal
+/help - Show this help message
+/status - Check bot status
+/stop - Stop the bot
+/stats - View performance statistics
+
+Use /signal to get a new trading signal anytime you want!
+
+Good luck with your trading! 📈
+"""
+
+_HELP_TEXT = """
+📖 **Binary Options Trading Bot - Help**
+
+**Signal Format:**
+Each signal includes:
+• Asset name and category
+• BUY/SELL direction
+• Confidence percentage
+• 3-minute expiration time
+• Entry reasoning
+• Current Nigeria time
+
+**Commands:**
+• `/start` - Start the bot
+• `/signal` - Get a new trading signal
+• `/help` - Show Commands help
+• `/status` - Bot status
+• `/stop` - Stop the bot
+• `/stats` - Performance percentage• `/alerts` - View and customize alert settings
+• `/setalert` - Modify specific alert settings
+
+**How It Works:**
+1. Request signals manually with /signal
+2. Advanced market analysis on demand
+3. Multiple technical indicators analyzed
+4. Signal validation for quality assurance
+5. 90% accuracy target with 75% minimum confidence
+
+**Asset Categories:**
+• Currency Pairs (EUR/USD, GBP/USD, etc.)
+• Commodities (Gold, Oil, Silver, etc.)
+• Stocks (AAPL, GOOGL, TSLA, etc.)
+• Indices (S&P 500, NASDAQ, etc.)
+
+**Important Notes:**
+• Signals expire in exactly 3 minutes
+• Trade responsibly and manage risk
+• Past performance doesn't guarantee future results
+• Always use proper risk management
+
+For support, contact the administrator.
+"""
+
+# /next reply; only the current time varies
+_NEXT_TEMPLATE = """
+🎯 **Manual Signal Generation**
+
+🕐 **Current Time:** {current_time}
+
+📊 **Signal Mode:** Manual (on-demand)
+⚡ **Get Signal:** Use /signal command anytime
+⏱️ **Expiration:** 3 minutes per signal
+🎯 **Quality:** 75%+ confidence guaranteed
+
+💡 **Ready for a signal?** Send /signal now!
+"""
+
+# Bot status scaffold; only the counters, times and footer change per request
+_STATUS_TEMPLATE = """
+📊 **Bot Status**
+
+🟢 **Status:** Running (Manual Mode)
+👥 **Active Users:** {active_users}
+🕐 **Current Time:** {current_time}
+
+🎯 **Signal Settings:**
+• Mode: Manual signal generation
+• Expiration: 3 minutes
+• Accuracy Target: 90%
+• Minimum Confidence: 75%
+
+📈 **Performance:**
+• Generated Signals: {generated_signals}
+• Validated Signals: {validated_signals}
+• Last Signal: {last_signal}
+
+{footer}
+"""
+_STATUS_COMMAND_FOOTER = "💡 **How to use:** Send /signal to get a new trading signal anytime!"
+_STATUS_MENU_FOOTER = "💡 **Use the menu below for quick actions:**"
+
+# Static replies, built once at import
+_MENU_TEXT = """
+🚀 **Binary Options Trading Bot Menu**
+
+Welcome! Use the buttons below for quick access to all features.
+
+🎯 Get instant trading signals
+⚙️ Customize your alert preferences  
+📊 View performance statistics
+💰 Track your trading portfolio
+
+Choose an option from the menu below:
+"""
+
+_HELP_MENU_TEXT = """
+📖 **Trading Bot Help**
+
+🎯 **Quick Actions:**
+• Get Signal - Generate new trading signal
+• Bot Status - Check current bot status
+• Alert Settings - Customize your notifications
+• Statistics - View performance data
+• Portfolio - Track your trading performance
+• Tutorial - Learn how to trade
+
+📱 **Commands:**
+• `/start` - Start the bot
+• `/signal` - Get trading signal
+• `/alerts` - View alert settings
+• `/setalert confidence 80` - Set minimum confidence
+• `/menu` - Show this menu anytime
+
+⚡ **Features:**
+• Manual signal generation
+• Custom alert settings
+• 90% accuracy target
+• 3-minute expiration
+• Nigeria time zone
+
+❓ **Need Help?** Contact support for assistance.
+"""
+
+_TUTORIAL_MENU_TEXT = """
+📚 **Binary Options Trading Tutorial**
+
+🎯 **Step 1: Get a Signal**
+• Click "🎯 Get Signal" button
+• Wait for analysis to complete
+• Note the direction (BUY/SELL)
+
+📱 **Step 2: Open Your Trading App**
+• Use Pocket Option or similar
+• Find the recommended asset
+• Set 3-minute expiration
+
+💰 **Step 3: Place Your Trade**
+• Enter your trade amount
+• Select BUY (CALL) or SELL (PUT)
+• Confirm the trade
+
+⏰ **Step 4: Wait for Results**
+• Monitor the 3-minute countdown
+• Check if prediction was correct
+• Collect your profits!
+
+🏆 **Pro Tips:**
+• Start with small amounts
+• Follow the confidence levels
+• Use proper risk management
+• Trade during active hours (10 AM & 5 PM)
+
+📈 **Next: Practice with demo account first!**
+"""
+
+_PORTFOLIO_MENU_TEXT = """
+💰 **Trading Portfolio**
+
+📈 **Today's Performance:**
+• Signals Received: 5
+• Successful Trades: 4
+• Win Rate: 80%
+• Profit: +₦2,400
+
+📊 **This Week:**
+• Total Signals: 23
+• Winning Trades: 19
+• Weekly Profit: +₦8,750
+
+🎯 **Strategy Performance:**
+• Best Asset: EUR/USD (90% win rate)
+• Favorite Time: 10:00-11:00 AM
+• Average Confidence: 84%
+
+💡 **Portfolio feature coming soon with trade tracking!**
+"""
+
+_PORTFOLIO_TEXT = """
+💰 **Trading Portfolio Dashboard**
+
+📈 **Today's Performance:**
+• Signals Received: 5
+• Successful Trades: 4
+• Win Rate: 80%
+• Profit: +₦2,400
+
+📊 **This Week:**
+• Total Signals: 23
+• Winning Trades: 19
+• Weekly Profit: +₦8,750
+
+🎯 **Strategy Performance:**
+• Best Asset: EUR/USD (90% win rate)
+• Favorite Time: 10:00-11:00 AM
+• Average Confidence: 84%
+
+📱 **Recent Signals:**
+• EUR/USD BUY - ✅ Won (+₦600)
+• BTC/USD SELL - ✅ Won (+₦800)
+• GBP/USD BUY - ❌ Lost (-₦400)
+• USD/JPY SELL - ✅ Won (+₦700)
+
+💡 **Full portfolio tracking feature coming soon!**
+"""
+
+_TUTORIAL_PARTS = (
+    """
+📚 **Binary Options Trading Tutorial - Part 1**
+
+🎯 **What are Binary Options?**
+Binary options are financial instruments where you predict if an asset's price will go UP (BUY/CALL) or DOWN (SELL/PUT) within a specific time frame.
+
+📊 **How Our Bot Helps:**
+• Analyzes market conditions
+• Provides BUY/SELL signals
+• 90% accuracy target
+• 3-minute expiration times
+
+🔄 **Basic Process:**
+1. Get signal from bot
+2. Open trading platform
+3. Find the asset
+4. Place trade in suggested direction
+5. Wait for 3 minutes
+6. Collect profit if correct!
+""",
+    """
+📚 **Binary Options Trading Tutorial - Part 2**
+
+💰 **Risk Management:**
+• Never risk more than 2-5% per trade
+• Start with small amounts (₦500-1000)
+• Don't chase losses
+• Set daily profit/loss limits
+
+⏰ **Best Trading Times:**
+• 10:00 AM (GMT+1) - Morning session
+• 5:00 PM (GMT+1) - Evening session
+• Avoid low-volume periods
+• Weekend trading is optional
+
+🎯 **Following Signals:**
+• Check confidence level (aim for 75%+)
+• Verify asset is available on your platform
+• Enter trade within 30 seconds of signal
+• Use exactly 3-minute expiration
+""",
+    """
+📚 **Binary Options Trading Tutorial - Part 3**
+
+📱 **Recommended Platforms:**
+• Pocket Option (most popular)
+• IQ Option
+• Quotex
+• ExpertOption
+
+🔧 **Platform Setup:**
+1. Register account
+2. Verify identity
+3. Make minimum deposit
+4. Practice on demo first
+5. Switch to real account when confident
+
+⚠️ **Important Notes:**
+• This bot provides signals, not guarantees
+• Past performance doesn't predict future results
+• Always trade responsibly
+• Never invest money you can't afford to lose
+
+✅ **Ready to start? Use /signal to get your first trading signal!**
+"""
+)
+
+# Telegram rejects messages longer than this
+_MAX_MESSAGE_LENGTH = 4096
+
+# Rows per message when /users has to be split
+_USERS_PER_CHUNK = 20
+
+# The whole tutorial as one message, so /tutorial costs a single send
+_TUTORIAL_TEXT = "\n\n━━━━━━━━\n\n".join(_TUTORIAL_PARTS)
+
 
 class TradingBot:
     """Main Telegram bot class for trading signals"""
     
+    __slots__ = (
+        "token", "logger", "signal_generator", "subscription_manager", "alert_manager",
+        "timezone_handler", "users", "is_running", "last_signal_time",
+        "application", "_main_menu_markup", "_alerts_menu_markup", "_broadcast_semaphore",
+        "_rate_limiter", "_chat_limiters", "_users_list_cache", "_command_routes", "_callback_routes", "_signal_executor", "_pending_signal", "_recent_signal"
+    )
+    
     def __init__(self, token: str):
         self.token = token
         self.logger = logging.getLogger(__name__)
@@ -27,41 +511,115 @@ class TradingBot:
         self.subscription_manager = SubscriptionManager()
         self.alert_manager = AlertManager()
         self.timezone_handler = TimezoneHandler()
-        self.scheduler = AsyncIOScheduler()
         
         # Bot state
-        self.active_users = set()
+        self.users = UserRegistry()  # activity, cached access and alert settings per user
         self.is_running = False
         self.last_signal_time = None
+        self._users_list_cache: Optional[Tuple[float, List[str]]] = None  # (built_at, formatted rows)
+        
+        # SignalGenerator keeps rotation and validation state, so it runs on one dedicated thread
+        self._signal_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="signal")
+        
+        # On-demand signal sharing: the generation in flight and the last result
+        self._pending_signal: Optional[asyncio.Future] = None
+        self._recent_signal: Optional[Tuple[Dict, float]] = None  # (signal_data, generated_at)
+        
+        # Outgoing message throttling shared by all fan-out paths
+        self._broadcast_semaphore = asyncio.Semaphore(BROADCAST_MAX_CONCURRENCY)
+        self._rate_limiter = AsyncTokenBucket(TELEGRAM_GLOBAL_RATE_LIMIT, 1.0)
+        # Per-chat buckets in least-recently-used order, pruned once they refill (see _chat_limiter)
+        self._chat_limiters: "OrderedDict[int, AsyncTokenBucket]" = OrderedDict()
+        
+        # Initialize application with one connection pool reused for all bot API calls;
+        # over HTTP/2 concurrent sends share a connection instead of queueing for keep-alive slots
+        http_version = TELEGRAM_HTTP_VERSION
+        if http_version == "2" and not _HTTP2_AVAILABLE:
+            self.logger.warning("HTTP/2 requested but the h2 package is missing, using HTTP/1.1")
+            http_version = "1.1"
+        request = HTTPXRequest(
+            connection_pool_size=TELEGRAM_CONNECTION_POOL_SIZE,
+            connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
+            read_timeout=TELEGRAM_READ_TIMEOUT,
+            pool_timeout=TELEGRAM_POOL_TIMEOUT,
+            http_version=http_version
+        )
+        # None of our messages link anywhere worth previewing
+        defaults = Defaults(link_preview_options=LinkPreviewOptions(is_disabled=True))
+        # Process updates concurrently so one slow /signal doesn't queue every other chat behind it
+        self.application = (
+            Application.builder()
+            .token(token)
+            .request(request)
+            .get_updates_request(HTTPXRequest(http_version=http_version))
+            .defaults(defaults)
+            .concurrent_updates(True)
+            .build()
+        )
+        
+        # The menus have no per-user fields, so build them once and share them
+        self._main_menu_markup = self._build_main_menu()
+        self._alerts_menu_markup = self._build_alerts_menu()
+        
+        # Inline button data -> handler, resolved with a single dict lookup
+        self._callback_routes: Dict[str, Callable] = {
+            "get_signal": self._handle_signal_callback,
+            "status": self._handle_status_callback,
+            "alerts": self._handle_alerts_callback,
+            "stats": self._handle_stats_callback,
+            "portfolio": self._handle_portfolio_callback,
+            "tutorial": self._handle_tutorial_callback,
+            "help": self._handle_help_callback,
+            "menu": self._handle_menu_callback,
+        }
+        
+        # Command name -> handler, resolved with a single dict lookup
+        self._command_routes: Dict[str, Callable] = {
+            "start": self.start_command,
+            "help": self.help_command,
+            "status": self.status_command,
+            "stop": self.stop_command,
+            "stats": self.stats_command,
+            "next": self.next_signal_command,
+            "signal": self.get_signal_command,
+            "verify": self.verify_payment_command,
+            "admin": self.admin_command,
+            "users": self.users_command,
+            "alerts": self.alerts_command,
+            "setalert": self.set_alert_command,
+            "menu": self.menu_command,
+            "portfolio": self.portfolio_command,
+            "tutorial": self.tutorial_command,
+        }
         
-        # Initialize application
-        self.application = Application.builder().token(token).build()
         self._setup_handlers()
         
     def _setup_handlers(self):
         """Setup command and message handlers"""
+        user_commands = [name for name in self._command_routes if name not in _ADMIN_COMMANDS]
+        
         handlers = [
-            CommandHandler("start", self.start_command),
-            CommandHandler("help", self.help_command),
-            CommandHandler("status", self.status_command),
-            CommandHandler("stop", self.stop_command),
-            CommandHandler("stats", self.stats_command),
-            CommandHandler("next", self.next_signal_command),
-            CommandHandler("signal", self.get_signal_command),
-            CommandHandler("verify", self.verify_payment_command),
-            CommandHandler("admin", self.admin_command),
-            CommandHandler("users", self.users_command),
-            CommandHandler("alerts", self.alerts_command),
-            CommandHandler("setalert", self.set_alert_command),
-            CommandHandler("menu", self.menu_command),
-            CommandHandler("portfolio", self.portfolio_command),
-            CommandHandler("tutorial", self.tutorial_command),
-            CallbackQueryHandler(self.handle_callback_query),
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message)
+            CommandHandler(user_commands, self._dispatch_command),
+            CommandHandler(list(_ADMIN_COMMANDS), self._dispatch_command, block=False),
+            CallbackQueryHandler(self.handle_callback_query)
         ]
         
         for handler in handlers:
             self.application.add_handler(handler)
+        
+        # Plain text goes in its own group so commands are matched first
+        self.application.add_handler(
+            MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message),
+            group=1
+        )
+    
+    async def _dispatch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Route a command to its handler by name"""
+        # "/Signal@SomeBot args" -> "signal"; like CommandHandler, read the name from the
+        # bot_command entity so trailing punctuation ("/signal.") isn't part of it
+        message = update.effective_message
+        command = message.text[1:message.entities[0].length].split("@", 1)[0].lower()
+        await self._command_routes[command](update, context)
     
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
@@ -70,7 +628,7 @@ class TradingBot:
         username = update.effective_user.username
         
         # Check user subscription status
-        has_access, access_message = self.subscription_manager.check_user_access(user_id)
+        has_access, access_message = self._cached_access(user_id)
         
         if not has_access:
             # User needs to pay
@@ -83,11 +641,13 @@ class TradingBot:
             # Register user for free access
             try:
                 if self.subscription_manager.register_free_user(user_id, username):
+                    self.users.invalidate_access(user_id)
+                    self._users_list_cache = None
                     access_message = "Free access granted!"
-                    self.logger.info(f"Free access granted to user {user_id} ({username})")
+                    self.logger.info("Free access granted to user %s (%s)", user_id, username)
                 else:
                     # Registration failed - slots might be full now
-                    self.logger.warning(f"Failed to register free user {user_id} - slots may be full")
+                    self.logger.warning("Failed to register free user %s - slots may be full", user_id)
                     payment_info = self.subscription_manager.get_payment_info()
                     await update.message.reply_text(
                         "❌ Free slots are now full. Please see payment options below:\n\n" + payment_info, 
@@ -95,142 +655,54 @@ class TradingBot:
                     )
                     return
             except Exception as e:
-                self.logger.error(f"Error registering free user {user_id}: {e}")
+                self.logger.error("Error registering free user %s: %s", user_id, e)
                 await update.message.reply_text(
                     "❌ Registration error occurred. Please try again or contact support."
                 )
                 return
         
-        self.active_users.add(user_id)
-        self.logger.info(f"User {user_name} ({user_id}) started the bot with {access_message}")
-        
-        welcome_message = f"""
-🚀 **Binary Options Trading Signals Bot**
-
-Welcome {user_name}! 
-
-✅ **Access Status:** {access_message}
-
-This bot provides high-accuracy binary options trading signals with:
-• 🎯 90% accuracy target
-• 📊 Manual signal generation
-• ⏱️ 3-minute expiration times
-• 📊 Multiple asset categories
-• 🇳🇬 Nigeria time (GMT+1)
-
-**Available Commands:**
-/start - Start the bot
-/signal - 🎯 Get a new trading signal
-/help - Show this help message
-/status - Check bot status
-/stop - Stop the bot
-/stats - View performance statistics
-
-Use /signal to get a new trading signal anytime you want!
-
-Good luck with your trading! 📈
-        """
+        self.users.activate(user_id)
+        self.logger.info("User %s (%s) started the bot with %s", user_name, user_id, access_message)
         
-        # Create bottom menu
-        keyboard = self._create_main_menu()
+        welcome_message = _WELCOME_TEMPLATE.format(user_name=user_name, access_message=access_message)
         
         await update.message.reply_text(
             welcome_message, 
             parse_mode='Markdown',
-            reply_markup=keyboard
+            reply_markup=self._main_menu_markup
         )
         
         # Manual signal generation - no automatic scheduler
-        self.logger.info(f"Manual signal mode - user can request signals with /signal")
+        self.logger.info("Manual signal mode - user can request signals with /signal")
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        help_text = """
-📖 **Binary Options Trading Bot - Help**
-
-**Signal Format:**
-Each signal includes:
-• Asset name and category
-• BUY/SELL direction
-• Confidence percentage
-• 3-minute expiration time
-• Entry reasoning
-• Current Nigeria time
-
-**Commands:**
-• `/start` - Start the bot
-• `/signal` - Get a new trading signal
-• `/help` - Show Commands help
-• `/status` - Bot status
-• `/stop` - Stop the bot
-• `/stats` - Performance percentage• `/alerts` - View and customize alert settings
-• `/setalert` - Modify specific alert settings
-
-**How It Works:**
-1. Request signals manually with /signal
-2. Advanced market analysis on demand
-3. Multiple technical indicators analyzed
-4. Signal validation for quality assurance
-5. 90% accuracy target with 75% minimum confidence
-
-**Asset Categories:**
-• Currency Pairs (EUR/USD, GBP/USD, etc.)
-• Commodities (Gold, Oil, Silver, etc.)
-• Stocks (AAPL, GOOGL, TSLA, etc.)
-• Indices (S&P 500, NASDAQ, etc.)
-
-**Important Notes:**
-• Signals expire in exactly 3 minutes
-• Trade responsibly and manage risk
-• Past performance doesn't guarantee future results
-• Always use proper risk management
-
-For support, contact the administrator.
-        """
-        
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+        await update.message.reply_text(_HELP_TEXT, parse_mode='Markdown')
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command"""
-        current_time = self.timezone_handler.now()
-        
-        # Calculate next signal time
-        next_signal_time = self.timezone_handler.get_next_signal_time(SIGNAL_INTERVAL_MINUTES)
-        time_until_next = next_signal_time - current_time
+        current_time = self.timezone_handler.now_cached()
         
-        # Format time until next signal
-        minutes_left = int(time_until_next.total_seconds() // 60)
-        seconds_left = int(time_until_next.total_seconds() % 60)
-        
-        status_text = f"""
-📊 **Bot Status**
-
-🟢 **Status:** Running (Manual Mode)
-👥 **Active Users:** {len(self.active_users)}
-🕐 **Current Time:** {self.timezone_handler.format_time(current_time)}
-
-🎯 **Signal Settings:**
-• Mode: Manual signal generation
-• Expiration: 3 minutes
-• Accuracy Target: 90%
-• Minimum Confidence: 75%
-
-📈 **Performance:**
-• Generated Signals: {self.signal_generator.generated_signals}
-• Validated Signals: {self.signal_generator.validated_signals}
-• Last Signal: {self.timezone_handler.format_time(self.last_signal_time) if self.last_signal_time else 'None'}
-
-💡 **How to use:** Send /signal to get a new trading signal anytime!
-        """
+        status_text = self._render_status(current_time, _STATUS_COMMAND_FOOTER)
         
         await update.message.reply_text(status_text, parse_mode='Markdown')
     
+    def _render_status(self, current_time: datetime, footer: str) -> str:
+        """Fill the bot status template with current values"""
+        return _STATUS_TEMPLATE.format(
+            active_users=self.users.active_count(),
+            current_time=self.timezone_handler.format_time(current_time),
+            generated_signals=self.signal_generator.generated_signals,
+            validated_signals=self.signal_generator.validated_signals,
+            last_signal=self.timezone_handler.format_time(self.last_signal_time) if self.last_signal_time else 'None',
+            footer=footer
+        )
+    
     async def stop_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stop command"""
         user_id = update.effective_user.id
         
-        if user_id in self.active_users:
-            self.active_users.remove(user_id)
+        if self.users.deactivate(user_id):
             await update.message.reply_text(
                 "🛑 You have been unsubscribed from trading signals.\n\n"
                 "Use /start to resume receiving signals."
@@ -246,13 +718,13 @@ For support, contact the administrator.
         user_id = update.effective_user.id
         
         # Check if user is admin for detailed stats
-        is_admin = user_id in ADMIN_USER_IDS
+        is_admin = user_id in _ADMIN_IDS
         
         stats = self.signal_generator.get_statistics()
         
         if is_admin:
-            # Detailed stats for admin
-            stats_text = f"""
+            # Detailed stats for admin, assembled from parts and joined once
+            parts = [f"""
 📊 **Detailed Statistics** (Admin)
 
 **Signal Generation:**
@@ -266,24 +738,24 @@ For support, contact the administrator.
 • Assets Used: {len(stats['asset_stats']['usage_count'])}
 
 **Top Used Assets:**
-            """
+            """]
             
             # Add top used assets
             usage_count = stats['asset_stats']['usage_count']
             if usage_count:
-                sorted_assets = sorted(usage_count.items(), key=lambda x: x[1], reverse=True)
-                for asset, count in sorted_assets[:5]:
-                    stats_text += f"• {asset}: {count} signals\n"
+                top_assets = heapq.nlargest(5, usage_count.items(), key=operator.itemgetter(1))
+                parts.extend(f"• {asset}: {count} signals\n" for asset, count in top_assets)
             
-            stats_text += f"""
+            parts.append(f"""
 **Validation Stats:**
 • Total Signals: {stats['validation_stats']['total_signals']}
 • Accuracy Tracker: {len(stats['validation_stats']['accuracy_tracker'])} assets
 
 **Bot Status:**
-• Active Users: {len(self.active_users)}
+• Active Users: {self.users.active_count()}
 • Running: {self.is_running}
-            """
+            """)
+            stats_text = "".join(parts)
         else:
             # Basic stats for regular users
             stats_text = f"""
@@ -295,7 +767,7 @@ For support, contact the administrator.
 • Accuracy Target: {stats['accuracy_target']}%
 
 **Bot Activity:**
-• Active Users: {len(self.active_users)}
+• Active Users: {self.users.active_count()}
 • Assets Available: {stats['asset_stats']['total_assets']}
 • Status: {'Running' if self.is_running else 'Stopped'}
 
@@ -308,20 +780,9 @@ For support, contact the administrator.
     
     async def next_signal_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /next command - redirect to manual signal generation"""
-        current_time = self.timezone_handler.now()
+        current_time = self.timezone_handler.now_cached()
         
-        next_text = f"""
-🎯 **Manual Signal Generation**
-
-🕐 **Current Time:** {self.timezone_handler.format_time(current_time)}
-
-📊 **Signal Mode:** Manual (on-demand)
-⚡ **Get Signal:** Use /signal command anytime
-⏱️ **Expiration:** 3 minutes per signal
-🎯 **Quality:** 75%+ confidence guaranteed
-
-💡 **Ready for a signal?** Send /signal now!
-        """
+        next_text = _NEXT_TEMPLATE.format(current_time=self.timezone_handler.format_time(current_time))
         
         await update.message.reply_text(next_text, parse_mode='Markdown')
 
@@ -331,7 +792,7 @@ For support, contact the administrator.
         user_name = update.effective_user.first_name
         
         # Check if user has access
-        has_access, access_message = self.subscription_manager.check_user_access(user_id)
+        has_access, access_message = self._cached_access(user_id)
         if not has_access:
             payment_info = self.subscription_manager.get_payment_info()
             await update.message.reply_text(
@@ -341,23 +802,35 @@ For support, contact the administrator.
             return
         
         # Add user to active users if not already there
-        self.active_users.add(user_id)
+        self.users.activate(user_id)
         
-        # Send "generating signal" message
-        generating_msg = await update.message.reply_text(
-            "🔄 **Generating Trading Signal...**\n\n"
-            "• Analyzing market conditions\n"
-            "• Running technical indicators\n"
-            "• Validating signal quality\n\n"
-            "⏳ Please wait..."
-        )
+        generating_msg = None
         
         try:
-            # Generate signal
-            signal_data = self.signal_generator.generate_signal()
+            # Generate signal, only showing a "generating" placeholder if it takes a while
+            signal_task = asyncio.ensure_future(self._generate_signal())
+            try:
+                signal_data = await asyncio.wait_for(
+                    asyncio.shield(signal_task), timeout=SIGNAL_PLACEHOLDER_DELAY_SECONDS
+                )
+            except asyncio.TimeoutError:
+                try:
+                    generating_msg = await update.message.reply_text(
+                        "🔄 **Generating Trading Signal...**\n\n"
+                        "• Analyzing market conditions\n"
+                        "• Running technical indicators\n"
+                        "• Validating signal quality\n\n"
+                        "⏳ Please wait..."
+                    )
+                finally:
+                    # Collect the generation even if the placeholder failed, so its outcome isn't lost
+                    signal_data = await signal_task
+            
+            # Answer with exactly one message: a new reply, or an edit of the placeholder
+            send = generating_msg.edit_text if generating_msg else update.message.reply_text
             
             if not signal_data:
-                await generating_msg.edit_text(
+                await send(
                     "❌ **No Valid Signal Available**\n\n"
                     "Current market conditions don't meet our quality standards.\n"
                     "Please try again in a few minutes.\n\n"
@@ -365,14 +838,15 @@ For support, contact the administrator.
                 )
                 return
             
-            # Format signal message
-            signal_message = self._format_signal_message(signal_data)
+            # One clock read for filtering, formatting and bookkeeping, shared across a burst of requests
+            now = self.timezone_handler.now_cached()
             
             # Check if user should receive this signal based on their alert settings
-            if not self.alert_manager.should_send_alert(user_id, signal_data):
+            if not self.alert_manager.should_send_alert(user_id, signal_data, now=now,
+                                                        settings=self._cached_settings(user_id)):
                 # Generate a different signal or show why this one was filtered
-                filtered_reason = self._get_filter_reason(user_id, signal_data)
-                await generating_msg.edit_text(
+                filtered_reason = self._get_filter_reason(user_id, signal_data, now=now)
+                await send(
                     f"🔍 **Signal Filtered by Your Settings**\n\n"
                     f"A {signal_data['direction']} signal was generated for {signal_data['asset']} "
                     f"with {signal_data['confidence']:.0f}% confidence, but it was filtered out.\n\n"
@@ -382,27 +856,61 @@ For support, contact the administrator.
                 )
                 return
             
-            # Edit the generating message with the actual signal
-            await generating_msg.edit_text(signal_message, parse_mode='Markdown')
+            # Format signal message (plain text, no Markdown entities to parse)
+            signal_message = self._format_signal_message(signal_data, now=now)
+            await send(signal_message)
             
-            self.last_signal_time = self.timezone_handler.now()
-            self.logger.info(f"Manual signal generated for user {user_name} ({user_id}): {signal_data['asset']} {signal_data['direction']}")
+            self.last_signal_time = now
+            self.logger.info(
+                "Manual signal generated for user %s (%s): %s %s",
+                user_name, user_id, signal_data['asset'], signal_data['direction']
+            )
             
         except Exception as e:
-            self.logger.error(f"Error generating manual signal for user {user_id}: {e}")
-            await generating_msg.edit_text(
+            self.logger.error("Error generating manual signal for user %s: %s", user_id, e)
+            send = generating_msg.edit_text if generating_msg else update.message.reply_text
+            await send(
                 "❌ **Signal Generation Error**\n\n"
                 "Sorry, there was an error generating your signal.\n"
                 "Please try again in a moment.\n\n"
                 "If the problem persists, contact support."
             )
 
+    async def _generate_signal(self) -> Optional[Dict]:
+        """Get a signal for an on-demand request, sharing one generation across a burst of requests"""
+        # Check for a signal generated moments ago
+        if self._recent_signal is not None:
+            signal_data, generated_at = self._recent_signal
+            if time.monotonic() - generated_at < SIGNAL_SHARE_WINDOW_SECONDS:
+                return signal_data
+        
+        # Join the generation already in flight, or start one
+        if self._pending_signal is None:
+            self._pending_signal = asyncio.ensure_future(self._run_signal_generation())
+        # Shielded so one requester giving up doesn't cancel it for the others
+        return await asyncio.shield(self._pending_signal)
+    
+    async def _run_signal_generation(self) -> Optional[Dict]:
+        """Run a shared on-demand generation and remember its result"""
+        try:
+            signal_data = await self._generate_in_executor()
+            if signal_data:
+                self._recent_signal = (signal_data, time.monotonic())
+            return signal_data
+        finally:
+            self._pending_signal = None
+    
+    async def _generate_in_executor(self) -> Optional[Dict]:
+        """Run signal generation on the signal thread so the event loop stays responsive"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._signal_executor, self.signal_generator.generate_signal)
+
     async def verify_payment_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /verify command - for admins to verify user payments"""
         admin_user_id = update.effective_user.id
         
         # Check if user is admin
-        if admin_user_id not in ADMIN_USER_IDS:
+        if admin_user_id not in _ADMIN_IDS:
             await update.message.reply_text("❌ This command is only available to administrators.")
             return
         
@@ -425,22 +933,16 @@ For support, contact the administrator.
             )
             
             if success:
+                self.users.invalidate_access(target_user_id)
+                self._users_list_cache = None
+                
+                # Notify the user in the background so the admin's ack isn't held up by it
+                self.application.create_task(self._notify_verified(update, target_user_id))
+                
                 await update.message.reply_text(
                     f"✅ Payment verified for user {target_user_id}\n"
                     f"User now has 30-day access to premium signals."
                 )
-                
-                # Try to notify the user
-                try:
-                    await self.application.bot.send_message(
-                        target_user_id,
-                        "🎉 **Payment Verified!**\n\n"
-                        "Your subscription has been activated!\n"
-                        "You now have access to premium trading signals for 30 days.\n\n"
-                        "Use /start to begin receiving signals."
-                    )
-                except Exception as e:
-                    await update.message.reply_text(f"⚠️ User verified but couldn't send notification: {e}")
             else:
                 await update.message.reply_text("❌ Failed to verify payment. Please check the user ID.")
                 
@@ -449,12 +951,26 @@ For support, contact the administrator.
         except Exception as e:
             await update.message.reply_text(f"❌ Error verifying payment: {e}")
 
+    async def _notify_verified(self, update: Update, target_user_id: int):
+        """Tell a user their payment was verified, reporting failures back to the admin"""
+        try:
+            await self._send_with_retry(
+                target_user_id,
+                "🎉 **Payment Verified!**\n\n"
+                "Your subscription has been activated!\n"
+                "You now have access to premium trading signals for 30 days.\n\n"
+                "Use /start to begin receiving signals."
+            )
+        except Exception as e:
+            self.logger.warning("Couldn't notify user %s of verified payment: %s", target_user_id, e)
+            await update.message.reply_text(f"⚠️ User verified but couldn't send notification: {e}")
+
     async def admin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /admin command - show admin statistics"""
         user_id = update.effective_user.id
         
         # Check if user is admin
-        if user_id not in ADMIN_USER_IDS:
+        if user_id not in _ADMIN_IDS:
             await update.message.reply_text("❌ This command is only available to administrators.")
             return
         
@@ -491,12 +1007,42 @@ For support, contact the administrator.
         user_id = update.effective_user.id
         
         # Check if user is admin
-        if user_id not in ADMIN_USER_IDS:
+        if user_id not in _ADMIN_IDS:
             await update.message.reply_text("❌ This command is only available to administrators.")
             return
         
+        # Reuse a recent listing; registrations and verifications clear it
+        cached = self._users_list_cache
+        if cached and time.monotonic() - cached[0] < USERS_LIST_CACHE_TTL_SECONDS:
+            users_list = cached[1]
+        else:
+            # Snapshot on the event loop, then format the (potentially long) list in a worker thread
+            subscriptions = list(self.subscription_manager.subscriptions.items())
+            users_list = await asyncio.to_thread(self._format_users_list, subscriptions)
+            self._users_list_cache = (time.monotonic(), users_list)
+        
+        if not users_list:
+            await update.message.reply_text("No users registered yet.")
+            return
+        
+        # Split into chunks if too long (rows plus the newlines joining them)
+        text_length = sum(map(len, users_list)) + len(users_list) - 1
+        if text_length > 4000:
+            # Send in chunks, in order, through the per-chat limiter so long listings don't hit flood control
+            rows = iter(users_list)
+            total_chunks = -(-len(users_list) // _USERS_PER_CHUNK)
+            for i in range(1, total_chunks + 1):
+                chunk_text = f"👥 **Users List ({i}/{total_chunks}):**\n\n" + "\n".join(islice(rows, _USERS_PER_CHUNK))
+                await self._send_with_retry(update.effective_chat.id, chunk_text, parse_mode='Markdown')
+        else:
+            full_text = f"👥 **All Users ({len(users_list)}):**\n\n" + "\n".join(users_list)
+            await update.message.reply_text(full_text, parse_mode='Markdown')
+
+    def _format_users_list(self, subscriptions: List[Tuple[str, Dict]]) -> List[str]:
+        """Format one line per subscription for the /users listing"""
         users_list = []
-        for user_id_str, subscription in self.subscription_manager.subscriptions.items():
+        now = datetime.now()
+        for user_id_str, subscription in subscriptions:
             user_info = f"👤 ID: {user_id_str}"
             if subscription.get('username'):
                 user_info += f" (@{subscription['username']})"
@@ -505,8 +1051,8 @@ For support, contact the administrator.
                 user_info += " - 🆓 Free"
             elif subscription.get('expiry_date'):
                 expiry = subscription['expiry_date']
-                if datetime.now() < expiry:
-                    days_left = (expiry - datetime.now()).days
+                if now < expiry:
+                    days_left = (expiry - now).days
                     user_info += f" - 💰 Paid ({days_left}d left)"
                 else:
                     user_info += " - ⏰ Expired"
@@ -515,28 +1061,14 @@ For support, contact the administrator.
                 
             users_list.append(user_info)
         
-        if not users_list:
-            await update.message.reply_text("No users registered yet.")
-            return
-        
-        # Split into chunks if too long
-        users_text = "\n".join(users_list)
-        if len(users_text) > 4000:
-            # Send in chunks
-            chunks = [users_list[i:i+20] for i in range(0, len(users_list), 20)]
-            for i, chunk in enumerate(chunks):
-                chunk_text = f"👥 **Users List ({i+1}/{len(chunks)}):**\n\n" + "\n".join(chunk)
-                await update.message.reply_text(chunk_text, parse_mode='Markdown')
-        else:
-            full_text = f"👥 **All Users ({len(users_list)}):**\n\n" + users_text
-            await update.message.reply_text(full_text, parse_mode='Markdown')
+        return users_list
 
     async def alerts_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /alerts command - show user's alert settings"""
         user_id = update.effective_user.id
         
         # Check if user has access
-        has_access, access_message = self.subscription_manager.check_user_access(user_id)
+        has_access, access_message = self._cached_access(user_id)
         if not has_access:
             await update.message.reply_text(
                 "❌ You need to subscribe to access alert settings.\n\n"
@@ -588,7 +1120,7 @@ For support, contact the administrator.
         user_id = update.effective_user.id
         
         # Check if user has access
-        has_access, access_message = self.subscription_manager.check_user_access(user_id)
+        has_access, access_message = self._cached_access(user_id)
         if not has_access:
             await update.message.reply_text(
                 "❌ You need to subscribe to access alert settings.\n\n"
@@ -614,70 +1146,23 @@ For support, contact the administrator.
         setting = args[0].lower()
         value = " ".join(args[1:])
         
+        parser = _SETTING_HANDLERS.get(setting)
+        if parser is None:
+            await update.message.reply_text(
+                f"❌ Unknown setting: `{setting}`\n\n"
+                "Use `/alerts` to see available settings.",
+                parse_mode='Markdown'
+            )
+            return
+        
         # Parse and validate settings
         try:
-            settings_update = {}
-            
-            if setting == "confidence":
-                settings_update["min_confidence"] = int(value)
-                
-            elif setting == "enabled":
-                settings_update["enabled"] = value.lower() in ["true", "yes", "1", "on"]
-                
-            elif setting in ["start", "begin"]:
-                # Validate time format
-                datetime.strptime(value, "%H:%M")
-                current_settings = self.alert_manager.get_user_settings(user_id)
-                alert_times = current_settings.get("alert_times", {})
-                alert_times["start"] = value
-                settings_update["alert_times"] = alert_times
-                
-            elif setting == "end":
-                # Validate time format
-                datetime.strptime(value, "%H:%M")
-                current_settings = self.alert_manager.get_user_settings(user_id)
-                alert_times = current_settings.get("alert_times", {})
-                alert_times["end"] = value
-                settings_update["alert_times"] = alert_times
-                
-            elif setting in ["types", "directions"]:
-                types = [t.strip().upper() for t in value.split(",")]
-                valid_types = {"BUY", "SELL"}
-                if all(t in valid_types for t in types):
-                    settings_update["signal_types"] = types
-                else:
-                    raise ValueError("Invalid signal types")
-                    
-            elif setting in ["assets", "pairs"]:
-                if value.lower() == "all":
-                    settings_update["preferred_assets"] = ["all"]
-                else:
-                    assets = [a.strip() for a in value.split(",")]
-                    settings_update["preferred_assets"] = assets
-                    
-            elif setting == "exclude":
-                if value.lower() == "none":
-                    ["excluded_assets"] = []
-                else:settings_update
-                    excluded = [a.strip() for a in value.split(",")]
-                    settings_update["excluded_assets"] = excluded
-                    
-            elif setting in ["maxhour", "max_hour", "ratelimit"]:
-                settings_update["max_signals_per_hour"] = int(value)
-                
-            elif setting == "weekend":
-                settings_update["weekend_alerts"] = value.lower() in ["true", "yes", "1", "on"]
-                
-            else:
-                await update.message.reply_text(
-                    f"❌ Unknown setting: `{setting}`\n\n"
-                    "Use `/alerts` to see available settings.",
-                    parse_mode='Markdown'
-                )
-                return
+            key, parsed_value = parser(value, self.alert_manager, user_id)
+            settings_update = {key: parsed_value}
             
             # Update settings
             if self.alert_manager.update_user_settings(user_id, settings_update):
+                self.users.invalidate_settings(user_id)
                 await update.message.reply_text(
                     f"✅ **Alert setting updated!**\n\n"
                     f"**{setting.title()}:** {value}\n\n"
@@ -698,10 +1183,8 @@ For support, contact the administrator.
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle regular messages"""
-        user_message = update.message.text.lower()
-        
         # Check for signal-related keywords
-        if any(keyword in user_message for keyword in ['signal', 'trade', 'buy', 'sell', 'option']):
+        if _KEYWORD_RE.search(update.message.text):
             await update.message.reply_text(
                 "📊 For trading signals, use /signal to get a new trading signal anytime.\n\n"
                 "Use /help for more information about available commands."
@@ -717,104 +1200,106 @@ For support, contact the administrator.
     async def generate_and_send_signal(self):
         """Generate and send signal to all active users"""
         try:
-            if not self.active_users:
+            if not self.users.active_count():
                 self.logger.info("No active users, skipping signal generation")
                 return
             
-            # Generate signal
-            signal_data = self.signal_generator.generate_signal()
+            # Generate signal off the event loop so updates keep flowing during analysis
+            signal_data = await self._generate_in_executor()
             
             if not signal_data:
                 self.logger.warning("No valid signal generated")
                 return
             
-            # Format signal message
-            signal_message = self._format_signal_message(signal_data)
+            # Format signal message once; every recipient gets the same text
+            now = self.timezone_handler.now()
+            signal_message = self._format_signal_message(signal_data, now=now)
             
-            # Send to all active users
-            for user_id in self.active_users.copy():
-                try:
-                    await self.application.bot.send_message(
-                        chat_id=user_id,
-                        text=signal_message,
-                        parse_mode='Markdown'
+            # Send to all active users concurrently, paced by the shared rate limiter
+            targets = self.users.active_snapshot()
+            source_id = await self._post_broadcast_source(signal_message) if targets else None
+            results = await asyncio.gather(
+                *(
+                    self._send_with_retry(
+                        user_id, signal_message, copy_of=source_id, timeout=BROADCAST_SEND_TIMEOUT_SECONDS
                     )
-                except Exception as e:
-                    self.logger.error(f"Failed to send signal to user {user_id}: {e}")
-                    # Remove user if bot blocked
-                    if "blocked" in str(e).lower():
-                        self.active_users.discard(user_id)
+                    for user_id in targets
+                ),
+                return_exceptions=True
+            )
+            
+            # Tally failures after the fan-out so the send path does no logging or set mutation
+            blocked = []
+            failed_count = 0
+            timed_out = 0
+            for user_id, result in zip(targets, results):
+                if isinstance(result, Exception):
+                    failed_count += 1
+                    self.logger.debug("Failed to send signal to user %s: %r", user_id, result)
+                    # Remove user if bot blocked (or the account is gone)
+                    if isinstance(result, Forbidden):
+                        blocked.append(user_id)
+                    # A slow chat is only temporarily unreachable; keep it for the next signal
+                    elif isinstance(result, TimedOut):
+                        timed_out += 1
+                    # The chat is gone for good (deleted account, never started the bot)
+                    elif isinstance(result, BadRequest) and _is_chat_not_found(result):
+                        blocked.append(user_id)
+                    # Malformed request, most likely a formatting problem on our side
+                    elif isinstance(result, BadRequest):
+                        self.logger.warning("Signal rejected for user %s: %s", user_id, result)
+            self.users.deactivate_many(blocked)
+            
+            if failed_count:
+                self.logger.warning(
+                    "Signal delivery failed for %d of %d users (%d blocked the bot, %d timed out)",
+                    failed_count, len(targets), len(blocked), timed_out
+                )
             
-            self.last_signal_time = self.timezone_handler.now()
-            self.logger.info(f"Signal sent to {len(self.active_users)} users: {signal_data['asset']} {signal_data['direction']}")
+            self.last_signal_time = now
+            self.logger.info(
+                "Signal sent to %d users: %s %s",
+                len(targets) - failed_count, signal_data['asset'], signal_data['direction']
+            )
             
         except Exception as e:
-            self.logger.error(f"Error in signal generation and sending: {e}")
+            self.logger.error("Error in signal generation and sending: %s", e)
     
-    def _get_filter_reason(self, user_id: int, signal_data: Dict) -> str:
+    def _get_filter_reason(self, user_id: int, signal_data: Dict, now: datetime) -> str:
         """Get reason why signal was filtered"""
-        settings = self.alert_manager.get_user_settings(user_id)
+        settings = self._cached_settings(user_id)
         
         # Check confidence
-        if signal_data.get("confidence", 0) < settings.get("min_confidence", 75):
-            return f"Confidence {signal_data.get('confidence'):.0f}% below your minimum of {settings.get('min_confidence')}%"
+        if signal_data.get("confidence", 0) < settings.min_confidence:
+            return f"Confidence {signal_data.get('confidence'):.0f}% below your minimum of {settings.min_confidence}%"
         
         # Check signal type
-        if signal_data.get("direction") not in settings.get("signal_types", ["BUY", "SELL"]):
+        if signal_data.get("direction") not in settings.signal_types:
             return f"{signal_data.get('direction')} signals are disabled in your settings"
         
         # Check asset preferences
         asset = signal_data.get("asset", "")
-        if asset in settings.get("excluded_assets", []):
+        if asset in settings.excluded_assets:
             return f"{asset} is in your excluded assets list"
         
-        preferred = settings.get("preferred_assets", ["all"])
-        if "all" not in preferred and asset not in preferred:
+        if settings.preferred_assets is not None and asset not in settings.preferred_assets:
             return f"{asset} is not in your preferred assets list"
         
         # Check time
-        current_time = self.timezone_handler.now().time()
-        alert_times = settings.get("alert_times", {})
-        start_time = datetime.strptime(alert_times.get("start", "09:00"), "%H:%M").time()
-        end_time = datetime.strptime(alert_times.get("end", "22:00"), "%H:%M").time()
-        
-        if not (start_time <= current_time <= end_time):
-            return f"Outside your active hours ({alert_times.get('start', '09:00')} - {alert_times.get('end', '22:00')})"
+        if not (settings.start_time <= now.time() <= settings.end_time):
+            return f"Outside your active hours ({settings.start_time:%H:%M} - {settings.end_time:%H:%M})"
         
         # Check weekend
-        if not settings.get("weekend_alerts", False):
-            current_day = self.timezone_handler.now().weekday()
+        if not settings.weekend_alerts:
+            current_day = now.weekday()
             if current_day >= 5:
                 return "Weekend alerts are disabled in your settings"
         
         return "Signal filtered by your custom settings"
 
-    def _format_signal_message(self, signal_data: Dict) -> str:
+    def _format_signal_message(self, signal_data: Dict, now: datetime) -> str:
         """Format signal data into a user-friendly message"""
-        asset = signal_data['asset']
-        category = signal_data['category']
         direction = signal_data['direction']
-        confidence = signal_data['confidence']
-        expiration_time = signal_data['expiration_time']
-        reasoning = signal_data['reasoning']
-        current_time = self.timezone_handler.now()
-        
-        # Format category display name
-        category_display = self.signal_generator.asset_manager.get_category_display_name(category)
-        
-        # Calculate time until expiration
-        time_until_expiration = self.timezone_handler.time_until_expiration(expiration_time)
-        
-        # Direction emoji
-        direction_emoji = "🟢" if direction == "BUY" else "🔴"
-        
-        # Confidence level indicator
-        if confidence >= 85:
-            confidence_indicator = "🔥 HIGH"
-        elif confidence >= 75:
-            confidence_indicator = "⚡ GOOD"
-        else:
-            confidence_indicator = "📊 FAIR"
         
         # Get entry price from analysis if available
         analysis = signal_data.get("analysis", {})
@@ -828,45 +1313,23 @@ For support, contact the administrator.
             if "close" in indicators:
                 entry_price = f"{indicators['close']:.5f}"
         
-        # Determine strategy based on reasoning
-        strategy = "RSI + MACD Divergence"
-        if "BOLLINGER" in reasoning:
-            strategy = "Bollinger Bands + RSI"
-        elif "STOCHASTIC" in reasoning:
-            strategy = "Stochastic + MACD"
-        elif "MACD" in reasoning:
-            strategy = "MACD + RSI"
+        # Strategy is classified once by the generator, not per recipient
+        strategy = signal_data['strategy']
         
         # Market condition from sentiment
         sentiment = analysis.get("sentiment", {})
-        market_condition = sentiment.get("category", "NEUTRAL").title()
-        if direction == "BUY":
-            market_condition += " + Bullish Cross Confirmed"
-        else:
-            market_condition += " + Bearish Cross Confirmed"
-        
-        signal_message = f"""Pocket Option Signal Alert
-🔔 Auto-Generated Trading Signal
-
-🕒 Time (GMT+1): {self.timezone_handler.format_time(current_time, "%H:%M")}
-📉 Asset: {asset}
-📈 Direction: {direction} ({'CALL' if direction == 'BUY' else 'PUT'})
-⏳ Expiry Time: 3 minutes
-🎯 Entry Price: {entry_price}
-⚠️ Confidence Level: {confidence:.0f}%
-📊 Strategy Used: {strategy}
-📍 Market Condition: {market_condition}
-
-✅ Wait for stable candle close before entry.
-
----
-
-📥 Signal Status:
-✅ Signal Activated
-📊 Result: Pending
-💰 Profit: Calculating..."""
-        
-        return signal_message
+        market_condition = sentiment.get("category", "NEUTRAL").title() + _MARKET_CONFIRMATIONS[direction]
+        
+        return _SIGNAL_TEMPLATE.format(
+            time=self.timezone_handler.format_time(now, "%H:%M"),
+            asset=signal_data['asset'],
+            direction=direction,
+            option_type=_OPTION_TYPES[direction],
+            entry_price=entry_price,
+            confidence=signal_data['confidence'],
+            strategy=strategy,
+            market_condition=market_condition
+        )
     
     async def setup_bot_commands(self):
         """Setup bot commands for the menu"""
@@ -899,21 +1362,32 @@ For support, contact the administrator.
             
             self.logger.info("Trading bot started successfully")
             
-            # Start polling for updates
-            await self.application.updater.start_polling(
-                drop_pending_updates=True,
-                allowed_updates=["message", "callback_query"]
-            )
+            # Receive updates by webhook when a public URL is configured, else by long polling
+            if WEBHOOK_URL:
+                await self.application.updater.start_webhook(
+                    listen=WEBHOOK_LISTEN,
+                    port=WEBHOOK_PORT,
+                    url_path=self.token,
+                    webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{self.token}",
+                    drop_pending_updates=True,
+                    allowed_updates=["message", "callback_query"]
+                )
+            else:
+                await self.application.updater.start_polling(
+                    timeout=POLLING_TIMEOUT,
+                    drop_pending_updates=True,
+                    allowed_updates=["message", "callback_query"]
+                )
             
-            # Keep the bot running using the correct method
-            import signal
+            # Keep the bot running until SIGINT/SIGTERM, handled inside the event loop
             stop_event = asyncio.Event()
-            
-            def signal_handler(signum, frame):
-                stop_event.set()
-            
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(signum, stop_event.set)
+                except NotImplementedError:
+                    # Windows event loops don't support add_signal_handler
+                    signal.signal(signum, lambda *_: loop.call_soon_threadsafe(stop_event.set))
             
             try:
                 await stop_event.wait()
@@ -921,7 +1395,7 @@ For support, contact the administrator.
                 pass
             
         except Exception as e:
-            self.logger.error(f"Error running bot: {e}")
+            self.logger.error("Error running bot: %s", e)
             raise
         finally:
             # Cleanup
@@ -930,41 +1404,143 @@ For support, contact the administrator.
     async def send_broadcast_message(self, message: str, admin_only: bool = False):
         """Send a broadcast message to all active users"""
         try:
-            subscription_data = self.subscription_manager._load_subscriptions()
-            sent_count = 0
+            # The manager keeps subscriptions in memory; don't re-read them from disk per broadcast
+            subscription_data = self.subscription_manager.subscriptions
             failed_count = 0
             
-            for user_id_str, user_info in subscription_data.items():
+            # Resolve recipients up front so the send tasks only do network I/O
+            # Admin-only broadcasts just look up the admins instead of testing every subscriber
+            if admin_only:
+                candidates = [user_id for user_id in _ADMIN_IDS if str(user_id) in subscription_data]
+            else:
+                candidates = list(subscription_data)
+            
+            recipients = []
+            for candidate in candidates:
                 try:
-                    user_id = int(user_id_str)
-                    
-                    # Skip if admin_only and user is not admin
-                    if admin_only and user_id not in ADMIN_USER_IDS:
-                        continue
+                    user_id = int(candidate)
                     
                     # Check if user has access
-                    has_access, _ = self.subscription_manager.check_user_access(user_id)
-                    if has_access:
-                        await self.application.bot.send_message(
-                            chat_id=user_id,
-                            text=message,
-                            parse_mode='Markdown'
-                        )
-                        sent_count += 1
-                        await asyncio.sleep(0.5)  # Rate limiting
+                    if self._cached_has_access(user_id):
+                        recipients.append(user_id)
                         
                 except Exception as e:
-                    self.logger.error(f"Failed to send message to user {user_id}: {e}")
+                    self.logger.error("Failed to check access for user %s: %s", candidate, e)
                     failed_count += 1
             
-            self.logger.info(f"Broadcast completed: {sent_count} sent, {failed_count} failed")
+            source_id = await self._post_broadcast_source(message, parse_mode='Markdown') if recipients else None
+            results = await asyncio.gather(
+                *(
+                    self._send_with_retry(
+                        user_id, message, copy_of=source_id, timeout=BROADCAST_SEND_TIMEOUT_SECONDS,
+                        parse_mode='Markdown'
+                    )
+                    for user_id in recipients
+                ),
+                return_exceptions=True
+            )
+            
+            sent_count = 0
+            blocked = []
+            for user_id, result in zip(recipients, results):
+                if isinstance(result, Exception):
+                    failed_count += 1
+                    # Users who blocked the bot, or whose chat no longer exists, won't get signals either
+                    if isinstance(result, Forbidden) or (isinstance(result, BadRequest) and _is_chat_not_found(result)):
+                        blocked.append(user_id)
+                    else:
+                        self.logger.error("Failed to send message to user %s: %s", user_id, result)
+                else:
+                    sent_count += 1
+            self.users.deactivate_many(blocked)
+            
+            self.logger.info(
+                "Broadcast completed: %d sent, %d failed (%d blocked the bot)",
+                sent_count, failed_count, len(blocked)
+            )
             return sent_count, failed_count
             
         except Exception as e:
-            self.logger.error(f"Error in broadcast: {e}")
+            self.logger.error("Error in broadcast: %s", e)
             return 0, 0
 
-    def _create_main_menu(self):
+    def _cached_access(self, user_id: int) -> Tuple[bool, str]:
+        """Check user access, reusing a recent result for up to ACCESS_CACHE_TTL_SECONDS"""
+        now = time.monotonic()
+        user_state = self.users.state(user_id)
+        if now - user_state.access_checked_at >= ACCESS_CACHE_TTL_SECONDS:
+            user_state.has_access, user_state.access_message = self.subscription_manager.check_user_access(user_id)
+            user_state.access_checked_at = now
+        return user_state.has_access, user_state.access_message
+    
+    def _cached_settings(self, user_id: int) -> ResolvedAlertSettings:
+        """Get a user's resolved alert settings, reusing them until /setalert changes them"""
+        user_state = self.users.state(user_id)
+        if user_state.settings is None:
+            user_state.settings = self.alert_manager.resolve_user_settings(user_id)
+        return user_state.settings
+    
+    def _cached_has_access(self, user_id: int) -> bool:
+        """Check user access through the TTL cache, ignoring the status message"""
+        return self._cached_access(user_id)[0]
+
+    async def _post_broadcast_source(self, text: str, **kwargs) -> Optional[int]:
+        """Post a broadcast to the log chat once, returning its message ID for copying, or None to send directly"""
+        if not BROADCAST_LOG_CHAT_ID:
+            return None
+        try:
+            source = await self._send_with_retry(BROADCAST_LOG_CHAT_ID, text, **kwargs)
+        except Exception as e:
+            self.logger.warning("Could not post broadcast to log chat %s, sending directly: %s", BROADCAST_LOG_CHAT_ID, e)
+            return None
+        return source.message_id
+
+    def _chat_limiter(self, chat_id: int) -> AsyncTokenBucket:
+        """Get a chat's rate limit bucket, dropping buckets of chats that have gone idle"""
+        limiters = self._chat_limiters
+        # A full bucket carries no state, so forget it; stop at the first one still throttling
+        while limiters and next(iter(limiters.values())).is_full():
+            limiters.popitem(last=False)
+        bucket = limiters.get(chat_id)
+        if bucket is None:
+            bucket = limiters[chat_id] = AsyncTokenBucket(TELEGRAM_PER_CHAT_RATE_LIMIT, 1.0)
+        else:
+            limiters.move_to_end(chat_id)
+        return bucket
+
+    async def _send_with_retry(self, chat_id: int, text: str, copy_of: Optional[int] = None,
+                               timeout: Optional[float] = None, **kwargs):
+        """Send a message within the per-chat and global rate limits, retrying once after flood control"""
+        # An optional per-request HTTP timeout, so a slow chat can't stall a broadcast fan-out
+        timeouts = {} if timeout is None else {"read_timeout": timeout, "write_timeout": timeout}
+        for attempt in range(2):
+            try:
+                # Wait for this chat's turn before taking a global slot, so a busy chat holds nobody else up
+                await self._chat_limiter(chat_id).acquire()
+                async with self._broadcast_semaphore:
+                    await self._rate_limiter.acquire()
+                    # Copy the log chat's broadcast post when there is one, else send the text itself
+                    if copy_of is not None:
+                        try:
+                            return await self.application.bot.copy_message(
+                                chat_id=chat_id, from_chat_id=BROADCAST_LOG_CHAT_ID, message_id=copy_of, **timeouts
+                            )
+                        except BadRequest as e:
+                            if _is_chat_not_found(e):
+                                raise
+                            # The log chat post can't be copied (deleted, rights lost): send the text itself
+                            self.logger.warning("Could not copy broadcast %s to %s, sending directly: %s", copy_of, chat_id, e)
+                            copy_of = None
+                            await self._rate_limiter.acquire()
+                    return await self.application.bot.send_message(chat_id=chat_id, text=text, **timeouts, **kwargs)
+            except RetryAfter as e:
+                if attempt:
+                    raise
+                # Back off for this chat only; other sends keep their slots
+                await asyncio.sleep(e.retry_after)
+
+    @staticmethod
+    def _build_main_menu() -> InlineKeyboardMarkup:
         """Create the main inline keyboard menu"""
         keyboard = [
             [
@@ -986,6 +1562,20 @@ For support, contact the administrator.
         ]
         return InlineKeyboardMarkup(keyboard)
 
+    @staticmethod
+    def _build_alerts_menu() -> InlineKeyboardMarkup:
+        """Create the alerts-specific inline keyboard menu"""
+        keyboard = [
+            [
+                InlineKeyboardButton("🔧 Quick Setup", callback_data="alert_quick"),
+                InlineKeyboardButton("⚙️ Advanced", callback_data="alert_advanced")
+            ],
+            [
+                InlineKeyboardButton("🔙 Back to Menu", callback_data="menu")
+            ]
+        ]
+        return InlineKeyboardMarkup(keyboard)
+
     async def handle_callback_query(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle inline keyboard button presses"""
         query = update.callback_query
@@ -995,10 +1585,8 @@ For support, contact the administrator.
         data = query.data
         
         # Check user access for protected commands
-        protected_commands = ["get_signal", "alerts", "stats", "portfolio"]
-        if data in protected_commands:
-            has_access, access_message = self.subscription_manager.check_user_access(user_id)
-            if not has_access:
+        if data in _PROTECTED_CALLBACKS:
+            if not self._cached_has_access(user_id):
                 payment_info = self.subscription_manager.get_payment_info()
                 await query.edit_message_text(
                     "❌ You need to subscribe to access this feature.\n\n" + payment_info,
@@ -1007,27 +1595,14 @@ For support, contact the administrator.
                 return
         
         # Route to appropriate handler
-        if data == "get_signal":
-            await self._handle_signal_callback(query, context)
-        elif data == "status":
-            await self._handle_status_callback(query, context)
-        elif data == "alerts":
-            await self._handle_alerts_callback(query, context)
-        elif data == "stats":
-            await self._handle_stats_callback(query, context)
-        elif data == "portfolio":
-            await self._handle_portfolio_callback(query, context)
-        elif data == "tutorial":
-            await self._handle_tutorial_callback(query, context)
-        elif data == "help":
-            await self._handle_help_callback(query, context)
-        elif data == "menu":
-            await self._handle_menu_callback(query, context)
+        handler = self._callback_routes.get(data)
+        if handler:
+            await handler(query, context)
 
     async def _handle_signal_callback(self, query, context):
         """Handle signal generation from menu"""
         user_id = query.from_user.id
-        self.active_users.add(user_id)
+        self.users.activate(user_id)
         
         await query.edit_message_text(
             "🔄 **Generating Trading Signal...**\n\n"
@@ -1038,22 +1613,22 @@ For support, contact the administrator.
         )
         
         try:
-            signal_data = self.signal_generator.generate_signal()
+            signal_data = await self._generate_signal()
             
             if not signal_data:
-                keyboard = self._create_main_menu()
                 await query.edit_message_text(
                     "❌ **No Valid Signal Available**\n\n"
                     "Current market conditions don't meet our quality standards.\n"
                     "Please try again in a few minutes.\n\n"
                     "🎯 We only provide signals with 75%+ confidence level.",
-                    reply_markup=keyboard
+                    reply_markup=self._main_menu_markup
                 )
                 return
             
-            if not self.alert_manager.should_send_alert(user_id, signal_data):
-                filtered_reason = self._get_filter_reason(user_id, signal_data)
-                keyboard = self._create_main_menu()
+            now = self.timezone_handler.now_cached()
+            if not self.alert_manager.should_send_alert(user_id, signal_data, now=now,
+                                                        settings=self._cached_settings(user_id)):
+                filtered_reason = self._get_filter_reason(user_id, signal_data, now=now)
                 await query.edit_message_text(
                     f"🔍 **Signal Filtered by Your Settings**\n\n"
                     f"A {signal_data['direction']} signal was generated for {signal_data['asset']} "
@@ -1061,85 +1636,50 @@ For support, contact the administrator.
                     f"**Reason:** {filtered_reason}\n\n"
                     f"💡 Use the menu below to adjust your settings.",
                     parse_mode='Markdown',
-                    reply_markup=keyboard
+                    reply_markup=self._main_menu_markup
                 )
                 return
             
-            signal_message = self._format_signal_message(signal_data)
-            keyboard = self._create_main_menu()
+            signal_message = self._format_signal_message(signal_data, now=now)
             
             await query.edit_message_text(
-                signal_message + "\n\n" + "🔽 **Quick Actions:**",
-                parse_mode='Markdown',
-                reply_markup=keyboard
+                signal_message + _QUICK_ACTIONS_FOOTER,
+                reply_markup=self._main_menu_markup
             )
             
-            self.last_signal_time = self.timezone_handler.now()
+            self.last_signal_time = now
             
         except Exception as e:
-            keyboard = self._create_main_menu()
             await query.edit_message_text(
                 "❌ **Signal Generation Error**\n\n"
                 "Sorry, there was an error generating your signal.\n"
                 "Please try again in a moment.",
-                reply_markup=keyboard
+                reply_markup=self._main_menu_markup
             )
 
     async def _handle_status_callback(self, query, context):
         """Handle status from menu"""
-        current_time = self.timezone_handler.now()
+        current_time = self.timezone_handler.now_cached()
         
-        status_text = f"""
-📊 **Bot Status**
-
-🟢 **Status:** Running (Manual Mode)
-👥 **Active Users:** {len(self.active_users)}
-🕐 **Current Time:** {self.timezone_handler.format_time(current_time)}
-
-🎯 **Signal Settings:**
-• Mode: Manual signal generation
-• Expiration: 3 minutes
-• Accuracy Target: 90%
-• Minimum Confidence: 75%
-
-📈 **Performance:**
-• Generated Signals: {self.signal_generator.generated_signals}
-• Validated Signals: {self.signal_generator.validated_signals}
-• Last Signal: {self.timezone_handler.format_time(self.last_signal_time) if self.last_signal_time else 'None'}
-
-💡 **Use the menu below for quick actions:**
-        """
+        status_text = self._render_status(current_time, _STATUS_MENU_FOOTER)
         
-        keyboard = self._create_main_menu()
-        await query.edit_message_text(status_text, parse_mode='Markdown', reply_markup=keyboard)
+        await query.edit_message_text(status_text, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def _handle_alerts_callback(self, query, context):
         """Handle alerts from menu"""
         user_id = query.from_user.id
         summary = self.alert_manager.get_alert_summary(user_id)
         
-        # Create alerts-specific menu
-        keyboard = [
-            [
-                InlineKeyboardButton("🔧 Quick Setup", callback_data="alert_quick"),
-                InlineKeyboardButton("⚙️ Advanced", callback_data="alert_advanced")
-            ],
-            [
-                InlineKeyboardButton("🔙 Back to Menu", callback_data="menu")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
         await query.edit_message_text(
             summary + "\n\n💡 Use commands like `/setalert confidence 80` to modify settings.",
             parse_mode='Markdown',
-            reply_markup=reply_markup
+            reply_markup=self._alerts_menu_markup
         )
 
     async def _handle_stats_callback(self, query, context):
         """Handle stats from menu"""
         user_id = query.from_user.id
-        is_admin = user_id in ADMIN_USER_IDS
+        is_admin = user_id in _ADMIN_IDS
         stats = self.signal_generator.get_statistics()
         
         if is_admin:
@@ -1153,7 +1693,7 @@ For support, contact the administrator.
 • Accuracy Target: {stats['accuracy_target']}%
 
 **Bot Status:**
-• Active Users: {len(self.active_users)}
+• Active Users: {self.users.active_count()}
 • Running: {self.is_running}
             """
         else:
@@ -1166,156 +1706,42 @@ For support, contact the administrator.
 • Accuracy Target: {stats['accuracy_target']}%
 
 **Bot Activity:**
-• Active Users: {len(self.active_users)}
+• Active Users: {self.users.active_count()}
 • Assets Available: {stats['asset_stats']['total_assets']}
 • Status: {'Running' if self.is_running else 'Stopped'}
             """
         
-        keyboard = self._create_main_menu()
-        await query.edit_message_text(stats_text, parse_mode='Markdown', reply_markup=keyboard)
+        await query.edit_message_text(stats_text, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def _handle_portfolio_callback(self, query, context):
         """Handle portfolio tracking from menu"""
         user_id = query.from_user.id
         
         # For now, show a placeholder portfolio
-        portfolio_text = f"""
-💰 **Trading Portfolio**
-
-📈 **Today's Performance:**
-• Signals Received: 5
-• Successful Trades: 4
-• Win Rate: 80%
-• Profit: +₦2,400
-
-📊 **This Week:**
-• Total Signals: 23
-• Winning Trades: 19
-• Weekly Profit: +₦8,750
-
-🎯 **Strategy Performance:**
-• Best Asset: EUR/USD (90% win rate)
-• Favorite Time: 10:00-11:00 AM
-• Average Confidence: 84%
-
-💡 **Portfolio feature coming soon with trade tracking!**
-        """
-        
-        keyboard = self._create_main_menu()
-        await query.edit_message_text(portfolio_text, parse_mode='Markdown', reply_markup=keyboard)
+        await query.edit_message_text(_PORTFOLIO_MENU_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def _handle_tutorial_callback(self, query, context):
         """Handle tutorial from menu"""
-        tutorial_text = """
-📚 **Binary Options Trading Tutorial**
-
-🎯 **Step 1: Get a Signal**
-• Click "🎯 Get Signal" button
-• Wait for analysis to complete
-• Note the direction (BUY/SELL)
-
-📱 **Step 2: Open Your Trading App**
-• Use Pocket Option or similar
-• Find the recommended asset
-• Set 3-minute expiration
-
-💰 **Step 3: Place Your Trade**
-• Enter your trade amount
-• Select BUY (CALL) or SELL (PUT)
-• Confirm the trade
-
-⏰ **Step 4: Wait for Results**
-• Monitor the 3-minute countdown
-• Check if prediction was correct
-• Collect your profits!
-
-🏆 **Pro Tips:**
-• Start with small amounts
-• Follow the confidence levels
-• Use proper risk management
-• Trade during active hours (10 AM & 5 PM)
-
-📈 **Next: Practice with demo account first!**
-        """
-        
-        keyboard = self._create_main_menu()
-        await query.edit_message_text(tutorial_text, parse_mode='Markdown', reply_markup=keyboard)
+        await query.edit_message_text(_TUTORIAL_MENU_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def _handle_help_callback(self, query, context):
         """Handle help from menu"""
-        help_text = """
-📖 **Trading Bot Help**
-
-🎯 **Quick Actions:**
-• Get Signal - Generate new trading signal
-• Bot Status - Check current bot status
-• Alert Settings - Customize your notifications
-• Statistics - View performance data
-• Portfolio - Track your trading performance
-• Tutorial - Learn how to trade
-
-📱 **Commands:**
-• `/start` - Start the bot
-• `/signal` - Get trading signal
-• `/alerts` - View alert settings
-• `/setalert confidence 80` - Set minimum confidence
-• `/menu` - Show this menu anytime
-
-⚡ **Features:**
-• Manual signal generation
-• Custom alert settings
-• 90% accuracy target
-• 3-minute expiration
-• Nigeria time zone
-
-❓ **Need Help?** Contact support for assistance.
-        """
-        
-        keyboard = self._create_main_menu()
-        await query.edit_message_text(help_text, parse_mode='Markdown', reply_markup=keyboard)
+        await query.edit_message_text(_HELP_MENU_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def _handle_menu_callback(self, query, context):
         """Handle menu refresh"""
-        welcome_text = """
-🚀 **Binary Options Trading Bot Menu**
-
-Welcome! Use the buttons below for quick access to all features.
-
-🎯 Get instant trading signals
-⚙️ Customize your alert preferences  
-📊 View performance statistics
-💰 Track your trading portfolio
-
-Choose an option from the menu below:
-        """
-        
-        keyboard = self._create_main_menu()
-        await query.edit_message_text(welcome_text, parse_mode='Markdown', reply_markup=keyboard)
+        await query.edit_message_text(_MENU_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /menu command"""
-        welcome_text = """
-🚀 **Binary Options Trading Bot Menu**
-
-Welcome! Use the buttons below for quick access to all features.
-
-🎯 Get instant trading signals
-⚙️ Customize your alert preferences  
-📊 View performance statistics
-💰 Track your trading portfolio
-
-Choose an option from the menu below:
-        """
-        
-        keyboard = self._create_main_menu()
-        await update.message.reply_text(welcome_text, parse_mode='Markdown', reply_markup=keyboard)
+        await update.message.reply_text(_MENU_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def portfolio_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /portfolio command"""
         user_id = update.effective_user.id
         
         # Check if user has access
-        has_access, access_message = self.subscription_manager.check_user_access(user_id)
+        has_access, access_message = self._cached_access(user_id)
         if not has_access:
             payment_info = self.subscription_manager.get_payment_info()
             await update.message.reply_text(
@@ -1324,124 +1750,30 @@ Choose an option from the menu below:
             )
             return
         
-        portfolio_text = """
-💰 **Trading Portfolio Dashboard**
-
-📈 **Today's Performance:**
-• Signals Received: 5
-• Successful Trades: 4
-• Win Rate: 80%
-• Profit: +₦2,400
-
-📊 **This Week:**
-• Total Signals: 23
-• Winning Trades: 19
-• Weekly Profit: +₦8,750
-
-🎯 **Strategy Performance:**
-• Best Asset: EUR/USD (90% win rate)
-• Favorite Time: 10:00-11:00 AM
-• Average Confidence: 84%
-
-📱 **Recent Signals:**
-• EUR/USD BUY - ✅ Won (+₦600)
-• BTC/USD SELL - ✅ Won (+₦800)
-• GBP/USD BUY - ❌ Lost (-₦400)
-• USD/JPY SELL - ✅ Won (+₦700)
-
-💡 **Full portfolio tracking feature coming soon!**
-        """
-        
-        keyboard = self._create_main_menu()
-        await update.message.reply_text(portfolio_text, parse_mode='Markdown', reply_markup=keyboard)
+        await update.message.reply_text(_PORTFOLIO_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def tutorial_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /tutorial command"""
-        tutorial_parts = [
-            """
-📚 **Binary Options Trading Tutorial - Part 1**
-
-🎯 **What are Binary Options?**
-Binary options are financial instruments where you predict if an asset's price will go UP (BUY/CALL) or DOWN (SELL/PUT) within a specific time frame.
-
-📊 **How Our Bot Helps:**
-• Analyzes market conditions
-• Provides BUY/SELL signals
-• 90% accuracy target
-• 3-minute expiration times
-
-🔄 **Basic Process:**
-1. Get signal from bot
-2. Open trading platform
-3. Find the asset
-4. Place trade in suggested direction
-5. Wait for 3 minutes
-6. Collect profit if correct!
-            """,
-            """
-📚 **Binary Options Trading Tutorial - Part 2**
-
-💰 **Risk Management:**
-• Never risk more than 2-5% per trade
-• Start with small amounts (₦500-1000)
-• Don't chase losses
-• Set daily profit/loss limits
-
-⏰ **Best Trading Times:**
-• 10:00 AM (GMT+1) - Morning session
-• 5:00 PM (GMT+1) - Evening session
-• Avoid low-volume periods
-• Weekend trading is optional
-
-🎯 **Following Signals:**
-• Check confidence level (aim for 75%+)
-• Verify asset is available on your platform
-• Enter trade within 30 seconds of signal
-• Use exactly 3-minute expiration
-            """,
-            """
-📚 **Binary Options Trading Tutorial - Part 3**
-
-📱 **Recommended Platforms:**
-• Pocket Option (most popular)
-• IQ Option
-• Quotex
-• ExpertOption
-
-🔧 **Platform Setup:**
-1. Register account
-2. Verify identity
-3. Make minimum deposit
-4. Practice on demo first
-5. Switch to real account when confident
-
-⚠️ **Important Notes:**
-• This bot provides signals, not guarantees
-• Past performance doesn't predict future results
-• Always trade responsibly
-• Never invest money you can't afford to lose
-
-✅ **Ready to start? Use /signal to get your first trading signal!**
-            """
-        ]
-        
-        keyboard = self._create_main_menu()
+        if len(_TUTORIAL_TEXT) <= _MAX_MESSAGE_LENGTH:
+            await update.message.reply_text(_TUTORIAL_TEXT, parse_mode='Markdown', reply_markup=self._main_menu_markup)
+            return
         
-        for i, part in enumerate(tutorial_parts):
-            if i == len(tutorial_parts) - 1:
-                # Last part gets the menu
-                await update.message.reply_text(part, parse_mode='Markdown', reply_markup=keyboard)
-            else:
-                await update.message.reply_text(part, parse_mode='Markdown')
+        # Too long for one message: send the parts in order, last one gets the menu
+        for part in _TUTORIAL_PARTS[:-1]:
+            await update.message.reply_text(part, parse_mode='Markdown')
+        await update.message.reply_text(_TUTORIAL_PARTS[-1], parse_mode='Markdown', reply_markup=self._main_menu_markup)
 
     async def cleanup(self):
         """Cleanup resources"""
         try:
             # No scheduler to shutdown in manual mode
+            if self.application.updater.running:
+                await self.application.updater.stop()
             await self.application.stop()
             await self.application.shutdown()
+            self._signal_executor.shutdown(wait=False, cancel_futures=True)
             
             self.logger.info("Bot cleanup completed")
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
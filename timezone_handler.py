@@ -2,6 +2,7 @@
 Timezone handling utilities for Nigeria time (GMT+1)
 """
 
+import time
 import pytz
 from datetime import datetime, timedelta
 from typing import Optional
@@ -12,11 +13,21 @@ class TimezoneHandler:
     def __init__(self, timezone_name: str = "Africa/Lagos"):
         self.timezone = pytz.timezone(timezone_name)
         self.utc = pytz.UTC
+        self._cached_now: Optional[datetime] = None
+        self._cached_at = 0.0  # monotonic time of the cached reading
     
     def now(self) -> datetime:
         """Get current time in the configured timezone"""
         return datetime.now(self.timezone)
     
+    def now_cached(self, ttl_ms: int = 100) -> datetime:
+        """Get current time, reusing the last reading for up to ttl_ms milliseconds"""
+        mono = time.monotonic()
+        if self._cached_now is None or mono - self._cached_at >= ttl_ms / 1000:
+            self._cached_now = datetime.now(self.timezone)
+            self._cached_at = mono
+        return self._cached_now
+    
     def utc_now(self) -> datetime:
         """Get current UTC time"""
         return datetime.now(self.utc)
@@ -48,16 +59,10 @@ class TimezoneHandler:
     def get_next_signal_time(self, interval_minutes: int = 5) -> datetime:
         """Calculate next signal time based on interval"""
         current_time = self.now()
-        # Round to next interval
-        minutes_since_hour = current_time.minute
-        next_interval = ((minutes_since_hour // interval_minutes) + 1) * interval_minutes
-        
-        if next_interval >= 60:
-            next_time = current_time.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-        else:
-            next_time = current_time.replace(minute=next_interval, second=0, microsecond=0)
-        
-        return next_time
+        # Round to next interval, rolling over to the top of the next hour at most
+        next_interval = ((current_time.minute // interval_minutes) + 1) * interval_minutes
+        hour_start = current_time.replace(minute=0, second=0, microsecond=0)
+        return hour_start + timedelta(minutes=min(next_interval, 60))
     
     def time_until_expiration(self, expiration_time: datetime) -> str:
         """Get human-readable time until expiration"""
@@ -0,0 +1,82 @@
+"""
+In-memory per-user state for the trading bot
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from bot.alert_manager import ResolvedAlertSettings
+
+
+@dataclass(slots=True)
+class UserState:
+    """Everything the bot remembers about one user between updates"""
+    active: bool = False  # receives broadcast signals
+    has_access: bool = False
+    access_message: str = ""
+    access_checked_at: float = float("-inf")  # monotonic time of the last access check
+    settings: Optional[ResolvedAlertSettings] = None  # None until first needed
+
+
+class UserRegistry:
+    """User states keyed by user ID, with a cached snapshot of the active users"""
+
+    __slots__ = ("_states", "_active_count", "_active_snapshot")
+
+    def __init__(self):
+        self._states: Dict[int, UserState] = {}
+        self._active_count = 0
+        self._active_snapshot: Optional[Tuple[int, ...]] = None  # rebuilt after activity changes
+
+    def state(self, user_id: int) -> UserState:
+        """Get a user's state, creating it on first sight"""
+        user_state = self._states.get(user_id)
+        if user_state is None:
+            user_state = self._states[user_id] = UserState()
+        return user_state
+
+    def activate(self, user_id: int):
+        """Start sending broadcast signals to a user"""
+        user_state = self.state(user_id)
+        if not user_state.active:
+            user_state.active = True
+            self._active_count += 1
+            self._active_snapshot = None
+
+    def deactivate(self, user_id: int) -> bool:
+        """Stop sending broadcast signals to a user, returning whether they were active"""
+        user_state = self._states.get(user_id)
+        if user_state is None or not user_state.active:
+            return False
+        user_state.active = False
+        self._active_count -= 1
+        self._active_snapshot = None
+        return True
+
+    def deactivate_many(self, user_ids: Iterable[int]):
+        """Stop sending broadcast signals to several users at once"""
+        for user_id in user_ids:
+            self.deactivate(user_id)
+
+    def active_count(self) -> int:
+        """Get the number of users receiving broadcast signals"""
+        return self._active_count
+
+    def active_snapshot(self) -> Tuple[int, ...]:
+        """Get the active user IDs as a tuple, reused until activity changes"""
+        if self._active_snapshot is None:
+            self._active_snapshot = tuple(
+                user_id for user_id, user_state in self._states.items() if user_state.active
+            )
+        return self._active_snapshot
+
+    def invalidate_access(self, user_id: int):
+        """Force the next access check for a user to hit the subscription store"""
+        user_state = self._states.get(user_id)
+        if user_state is not None:
+            user_state.access_checked_at = float("-inf")
+
+    def invalidate_settings(self, user_id: int):
+        """Force the next settings read for a user to reload from the alert manager"""
+        user_state = self._states.get(user_id)
+        if user_state is not None:
+            user_state.settings = None